@@ -1,26 +1,64 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from lxml.etree import HTMLParser, XPath
 import json
 import time
 import csv
 import os
 import re
-from urllib.parse import urljoin, urlparse
+import shutil
+from collections import namedtuple
+from functools import lru_cache
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Precompiled patterns for phone name cleanup
+_RE_FILENAME_CLEANUP = re.compile(r'\s*(?:hands-on\s*)?review\s*|\s*&\s*', re.IGNORECASE)
+_RE_NAME_CLEANUP = re.compile(r'\([^)]*\)|\s*(?:hands-on\s*)?review\s*|&', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+_RE_NONWORD = re.compile(r'[^\w\s-]')
+_INVALID_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+def _filename_cleanup_repl(match):
+    return ' and ' if '&' in match.group() else ' '
+
+def _name_cleanup_repl(match):
+    return 'and' if match.group() == '&' else ''
+
+# Precompiled XPath lookups for the pictures page
+_XP_MAIN_IMG = XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' specs-photo-main ')]//img/@src")
+_XP_PICTURES_LIST = XPath("//div[@id='pictures-list']")
+_XP_PICTURES_LINKS = XPath("//div[@id='pictures-list']//a/@href")
+_XP_PICTURES_IMGS = XPath("//div[@id='pictures-list']//img/@src")
+_XP_ALL_IMGS = XPath("//img/@src")
+
+# Images smaller than this are icons or placeholders, not phone photos
+MIN_IMAGE_BYTES = 2048
+
+# Directories already created by download_image in this process
+_MADE_DIRS = set()
+
+# Image URL filters for candidates found on the pictures page
+_IMG_RE = re.compile(r'\.(?:jpe?g|png|webp)(?:\?|$)', re.IGNORECASE)
+_SKIP_RE = re.compile(r'icon|logo|sprite|button|blank', re.IGNORECASE)
+
+CleanInfo = namedtuple('CleanInfo', 'safe_name display_name brand model')
+
+@lru_cache(maxsize=2048)
 def sanitize_filename(filename):
     """
     Sanitize filename to remove invalid characters and clean up the name
     """
-    # Remove review text and other unwanted phrases
-    filename = re.sub(r'\s*(?:hands-on\s*)?review\s*', ' ', filename, flags=re.IGNORECASE)
-    filename = re.sub(r'\s*&\s*', ' and ', filename)
+    # Remove review text and spell out ampersands in a single pass
+    filename = _RE_FILENAME_CLEANUP.sub(_filename_cleanup_repl, filename)
     
-    # Remove or replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    # Replace invalid characters
+    filename = filename.translate(_INVALID_TABLE)
     
     # Remove extra spaces and clean up
-    filename = re.sub(r'\s+', ' ', filename).strip()
+    filename = _RE_WS.sub(' ', filename).strip()
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
@@ -31,20 +69,18 @@ def sanitize_filename(filename):
     
     return filename
 
+@lru_cache(maxsize=4096)
 def clean_phone_name(phone_name):
     """
     Extract a clean phone name for folder and file naming
+    Returns a CleanInfo tuple; use ._asdict() where a dict is needed
     """
-    # Remove review text
-    clean_name = re.sub(r'\s*(?:hands-on\s*)?review\s*', '', phone_name, flags=re.IGNORECASE)
-    
-    # Remove anything in parentheses
-    clean_name = re.sub(r'\([^)]*\)', '', clean_name)
+    # Remove review text and anything in parentheses, spell out ampersands
+    clean_name = _RE_NAME_CLEANUP.sub(_name_cleanup_repl, phone_name)
     
     # Remove extra spaces and special characters
-    clean_name = re.sub(r'[&]', 'and', clean_name)
-    clean_name = re.sub(r'[^\w\s-]', '', clean_name)
-    clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+    clean_name = _RE_NONWORD.sub('', clean_name)
+    clean_name = _RE_WS.sub(' ', clean_name).strip()
     
     # Common brand mappings for consistency
     brand_mappings = {
@@ -69,41 +105,87 @@ def clean_phone_name(phone_name):
     # Create a clean display name
     display_name = f"{brand} {model}" if model else brand
     
-    return {
-        'safe_name': sanitize_filename(clean_name),
-        'display_name': display_name,
-        'brand': brand,
-        'model': model
-    }
+    return CleanInfo(
+        safe_name=sanitize_filename(clean_name),
+        display_name=display_name,
+        brand=brand,
+        model=model
+    )
 
-def download_image(image_url, save_path, headers):
+def create_session(headers):
+    """
+    Create a pooled HTTP session so all requests to gsmarena.com reuse connections
+    One pool is kept per host (www for pages, fdn/fdn2 for images), so switching
+    hosts does not evict the warm connections of another
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('https://', adapter)
+    
+    return session
+
+def download_image(image_url, save_path, session):
     """
     Download a single image from URL and save to disk
+    Untrusted URLs are checked with a HEAD request first so tiny placeholder
+    images (below MIN_IMAGE_BYTES) are skipped without fetching the body
     """
     try:
-        response = requests.get(image_url, headers=headers, timeout=15, stream=True)
+        if '/vv/bigpic/' not in image_url:
+            try:
+                head = session.head(image_url, timeout=5, allow_redirects=True)
+                content_length = int(head.headers.get('Content-Length', '0'))
+                if head.ok and 0 < content_length < MIN_IMAGE_BYTES:
+                    print(f"      ✗ Skipping placeholder ({content_length} bytes): {image_url}")
+                    return False
+            except (requests.RequestException, ValueError):
+                # HEAD not supported or bad header, fall through to the GET
+                pass
+        
+        response = session.get(image_url, timeout=15, stream=True)
         response.raise_for_status()
         
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        # Create directory if this process hasn't already
+        save_dir = os.path.dirname(save_path)
+        if save_dir not in _MADE_DIRS:
+            os.makedirs(save_dir, exist_ok=True)
+            _MADE_DIRS.add(save_dir)
         
-        # Save image
+        # Save image, copying the raw stream in 64KB blocks
+        response.raw.decode_content = True
         with open(save_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, length=65536)
         
         # Verify the file was created and has content
         if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
             return True
         else:
             return False
-    except requests.exceptions.HTTPError as e:
-        print(f"HTTP Error {e.response.status_code}")
-        return False
     except Exception as e:
-        print(f"Error: {str(e)[:50]}")
+        print(f"      ✗ Error: {str(e)[:50]}: {image_url}")
         return False
 
+def absolute_url(src, base='https://www.gsmarena.com/'):
+    """
+    Resolve a gsmarena.com src/href against the site root without urljoin's full parse
+    """
+    if src.startswith(('http://', 'https://')):
+        return src
+    if src.startswith('//'):
+        return 'https:' + src
+    return base + src.lstrip('/')
+
 def construct_pictures_url(spec_url):
     """
     Construct pictures URL from specification URL
@@ -131,82 +213,79 @@ def construct_pictures_url(spec_url):
         print(f"      ✗ Error constructing URL: {e}")
         return None
 
-def scrape_images_from_pictures_page(pictures_url, headers, max_images=5):
+def scrape_images_from_pictures_page(pictures_url, session, max_images=5):
     """
     Scrape image URLs from the pictures page
     Looks specifically in the #pictures-list div and specs-photo-main div
     """
     try:
-        response = requests.get(pictures_url, headers=headers, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Feed the (transparently decompressed) body into lxml as it arrives
+        parser = HTMLParser()
+        with session.get(pictures_url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+        doc = parser.close()
         
         image_urls = []
+        seen = set()
         
         # First, look for the main image in specs-photo-main div
         print(f"      Looking for main image in specs-photo-main...")
-        specs_photo_main = soup.find('div', class_='specs-photo-main')
-        if specs_photo_main:
-            img_tag = specs_photo_main.find('img')
-            if img_tag and img_tag.get('src'):
-                main_img_src = img_tag['src']
-                # Make absolute URL
-                main_img_url = urljoin('https://www.gsmarena.com/', main_img_src)
-                
-                # Try to get larger version if it's a thumbnail
-                if '/vv/bigpic/' in main_img_url or '/vv/pics/' in main_img_url:
-                    # Already a good quality image
-                    pass
-                elif 'thumb' in main_img_url.lower():
-                    # Try to convert thumbnail to full size
-                    main_img_url = main_img_url.replace('thumb', 'pics')
-                
-                if main_img_url not in image_urls:
-                    image_urls.append(main_img_url)
-                    print(f"      ✓ Found main image in specs-photo-main")
+        main_srcs = _XP_MAIN_IMG(doc)
+        if main_srcs and main_srcs[0]:
+            # Make absolute URL
+            main_img_url = absolute_url(main_srcs[0])
+            
+            # Try to get larger version if it's a thumbnail
+            if '/vv/bigpic/' in main_img_url or '/vv/pics/' in main_img_url:
+                # Already a good quality image
+                pass
+            elif 'thumb' in main_img_url.lower():
+                # Try to convert thumbnail to full size
+                main_img_url = main_img_url.replace('thumb', 'pics')
+            
+            if main_img_url not in seen:
+                seen.add(main_img_url)
+                image_urls.append(main_img_url)
+                print(f"      ✓ Found main image in specs-photo-main")
         
         # Then look for the pictures-list div
-        pictures_list = soup.find('div', id='pictures-list')
+        has_pictures_list = bool(_XP_PICTURES_LIST(doc))
+        
+        pictures_list_yielded = 0
         
-        if pictures_list:
+        if has_pictures_list and len(image_urls) < max_images:
             # Find all image links within pictures-list
-            links = pictures_list.find_all('a', href=True)
-            
-            for link in links:
-                href = link['href']
-                
+            for href in _XP_PICTURES_LINKS(doc):
                 # GSMArena image links typically point to full-size images
-                if '.jpg' in href or '.png' in href or '.webp' in href:
+                if _IMG_RE.search(href):
                     # Make absolute URL
-                    img_url = urljoin('https://www.gsmarena.com/', href)
+                    img_url = absolute_url(href)
                     
-                    if img_url not in image_urls:
+                    if img_url not in seen:
+                        seen.add(img_url)
                         image_urls.append(img_url)
+                        pictures_list_yielded += 1
                         
                         if len(image_urls) >= max_images:
                             break
         
-        # If no images found in pictures-list, try finding img tags
-        if len(image_urls) <= 1:  # Only has main image or none
+        # If pictures-list links yielded nothing, try finding img tags
+        if pictures_list_yielded == 0 and len(image_urls) < max_images:
             print(f"      Few images found, trying additional img tags...")
             
-            if pictures_list:
-                img_tags = pictures_list.find_all('img')
+            if has_pictures_list:
+                img_srcs = _XP_PICTURES_IMGS(doc)
             else:
                 # Try the whole page
-                img_tags = soup.find_all('img')
+                img_srcs = _XP_ALL_IMGS(doc)
             
-            for img in img_tags:
-                src = img.get('src', '')
-                
-                # Skip very small images (icons, logos, etc.)
-                if any(skip in src.lower() for skip in ['icon', 'logo', 'sprite', 'button', 'blank']):
-                    continue
-                
-                # Look for actual phone images
-                if src and ('.jpg' in src or '.png' in src or '.webp' in src):
+            for src in img_srcs:
+                # Look for actual phone images, skipping icons, logos, etc.
+                if _IMG_RE.search(src) and not _SKIP_RE.search(src):
                     # Make absolute URL
-                    img_url = urljoin('https://www.gsmarena.com/', src)
+                    img_url = absolute_url(src)
                     
                     # Try to get larger version if it's a thumbnail
                     if '/vv/bigpic/' in img_url or '/vv/pics/' in img_url:
@@ -216,7 +295,8 @@ def scrape_images_from_pictures_page(pictures_url, headers, max_images=5):
                         # Try to convert thumbnail to full size
                         img_url = img_url.replace('thumb', 'pics')
                     
-                    if img_url not in image_urls:
+                    if img_url not in seen:
+                        seen.add(img_url)
                         image_urls.append(img_url)
                         
                         if len(image_urls) >= max_images:
@@ -228,7 +308,7 @@ def scrape_images_from_pictures_page(pictures_url, headers, max_images=5):
         print(f"      ✗ Error scraping images: {e}")
         return []
 
-def download_phone_images(phone_name, spec_url, headers, images_dir='images', max_images=5):
+def download_phone_images(phone_name, spec_url, session, images_dir='images', max_images=5):
     """
     Download up to max_images for a phone with clean naming
     Returns: list of local image paths and clean phone info
@@ -236,7 +316,7 @@ def download_phone_images(phone_name, spec_url, headers, images_dir='images', ma
     print(f"    Constructing pictures URL...")
     
     # Clean the phone name for better folder structure
-    clean_info = clean_phone_name(phone_name)
+    clean_info = clean_phone_name(phone_name)._asdict()
     safe_name = clean_info['safe_name']
     display_name = clean_info['display_name']
     
@@ -255,7 +335,7 @@ def download_phone_images(phone_name, spec_url, headers, images_dir='images', ma
     
     # Scrape image URLs
     print(f"    Scraping images from #pictures-list and .specs-photo-main...")
-    image_urls = scrape_images_from_pictures_page(pictures_url, headers, max_images)
+    image_urls = scrape_images_from_pictures_page(pictures_url, session, max_images)
     
     if not image_urls:
         print(f"      ✗ No images found")
@@ -263,14 +343,11 @@ def download_phone_images(phone_name, spec_url, headers, images_dir='images', ma
     
     print(f"    ✓ Found {len(image_urls)} image URLs")
     
-    # Create phone-specific directory with clean name
+    # Phone-specific directory with clean name, created by download_image
     phone_dir = os.path.join(images_dir, safe_name)
-    os.makedirs(phone_dir, exist_ok=True)
-    
-    # Download images with clean naming
-    downloaded_paths = []
-    print(f"    Downloading images with clean names...")
     
+    # Build clean filenames for each image
+    downloads = []
     for idx, img_url in enumerate(image_urls, 1):
         # Get file extension from URL
         parsed_url = urlparse(img_url)
@@ -286,56 +363,76 @@ def download_phone_images(phone_name, spec_url, headers, images_dir='images', ma
         else:
             filename = f"angle_{idx}{ext}"  # "angle_2.jpg", "angle_3.jpg", etc.
         
-        save_path = os.path.join(phone_dir, filename)
-        
-        print(f"      [{idx}/{len(image_urls)}] {filename}...", end=' ')
-        
-        if download_image(img_url, save_path, headers):
-            downloaded_paths.append(save_path)
-            file_size = os.path.getsize(save_path) / 1024  # KB
-            print(f"✓ ({file_size:.1f} KB)")
-        else:
-            print(f"✗")
+        downloads.append((img_url, os.path.join(phone_dir, filename)))
+    
+    # Download images concurrently over the pooled session
+    downloaded_paths = []
+    print(f"    Downloading images with clean names...")
+    
+    # Dispatch grouped by host so same-host downloads share pooled connections
+    dispatch_order = sorted(range(len(downloads)), key=lambda i: urlparse(downloads[i][0]).netloc)
+    
+    with ThreadPoolExecutor(max_workers=max_images) as executor:
+        results = dict(zip(dispatch_order, executor.map(
+            lambda i: download_image(downloads[i][0], downloads[i][1], session), dispatch_order)))
         
-        # Small delay between image downloads
-        time.sleep(0.5)
+        for idx, (img_url, save_path) in enumerate(downloads, 1):
+            success = results[idx - 1]
+            filename = os.path.basename(save_path)
+            
+            if success:
+                downloaded_paths.append(save_path)
+                file_size = os.path.getsize(save_path) / 1024  # KB
+                print(f"      [{idx}/{len(downloads)}] {filename}... ✓ ({file_size:.1f} KB)")
+            else:
+                print(f"      [{idx}/{len(downloads)}] {filename}... ✗")
     
     return downloaded_paths, clean_info
 
 def process_phones_from_csv(csv_file, images_dir='images', max_phones=None, 
-                            max_images_per_phone=5, delay=2, start_from=0):
+                            max_images_per_phone=5, delay=2, start_from=0, max_workers=3,
+                            manifest_file='image_manifest.jsonl'):
     """
     Read phones from CSV and download images for each with clean naming
+    
+    Up to max_workers phones are processed at once over a shared session;
+    each worker waits delay seconds before starting its next phone.
+    Each successful phone is appended to manifest_file as one JSON line as
+    soon as it finishes. Returns the number of phones with images.
     """
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',
         'Connection': 'keep-alive',
         'Referer': 'https://www.gsmarena.com/',
         'Upgrade-Insecure-Requests': '1'
     }
+    session = create_session(headers)
     
     # Read CSV file
     print(f"Reading phones from {csv_file}...")
     phones = []
     
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Try to find spec_url in different possible column names
-                spec_url = row.get('spec_url') or row.get('_metadata - spec_url') or row.get('review_url')
-                
-                if 'phone_name' in row and spec_url:
-                    phones.append({
-                        'phone_name': row['phone_name'],
-                        'spec_url': spec_url
-                    })
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            
+            # Resolve column positions once; spec_url may live in different columns
+            name_idx = header.index('phone_name') if 'phone_name' in header else None
+            url_idxs = [header.index(col) for col in ('spec_url', '_metadata - spec_url', 'review_url')
+                        if col in header]
+            
+            if name_idx is not None:
+                for row in reader:
+                    spec_url = next((row[i] for i in url_idxs if i < len(row) and row[i]), None)
+                    
+                    if spec_url and name_idx < len(row):
+                        phones.append((row[name_idx], spec_url))
     except Exception as e:
         print(f"✗ Error reading CSV: {e}")
-        return {}
+        return 0
     
     print(f"Found {len(phones)} phones in CSV")
     
@@ -348,26 +445,22 @@ def process_phones_from_csv(csv_file, images_dir='images', max_phones=None,
         phones = phones[:max_phones]
         print(f"Limiting to {max_phones} phones")
     
+    # Group phones by host to keep keep-alive connections warm
+    phones.sort(key=lambda phone: urlparse(phone[1]).netloc)
+    
     print("=" * 80)
     
     # Create main images directory
     os.makedirs(images_dir, exist_ok=True)
     
-    # Process each phone
-    results = {}
-    successful = 0
-    failed = 0
-    
-    for idx, phone in enumerate(phones, 1):
-        phone_name = phone['phone_name']
-        spec_url = phone['spec_url']
+    def process_phone(idx, phone):
+        phone_name, spec_url = phone
         
         print(f"\n[{idx}/{len(phones)}] {phone_name}")
         
         if not spec_url:
             print(f"  ✗ No spec URL found, skipping...")
-            failed += 1
-            continue
+            return phone_name, None
         
         print(f"  Spec URL: {spec_url}")
         
@@ -375,46 +468,72 @@ def process_phones_from_csv(csv_file, images_dir='images', max_phones=None,
         image_paths, clean_info = download_phone_images(
             phone_name=phone_name,
             spec_url=spec_url,
-            headers=headers,
+            session=session,
             images_dir=images_dir,
             max_images=max_images_per_phone
         )
         
+        record = None
         if image_paths:
-            results[phone_name] = {
+            record = {
                 'spec_url': spec_url,
                 'image_count': len(image_paths),
                 'image_paths': image_paths,
                 'clean_info': clean_info
             }
-            print(f"  ✓ Successfully downloaded {len(image_paths)} images")
-            print(f"  ✓ Clean name: {clean_info['display_name']}")
-            successful += 1
+            print(f"  ✓ [{idx}/{len(phones)}] Downloaded {len(image_paths)} images for {clean_info['display_name']}")
         else:
-            print(f"  ✗ Failed to download images")
-            failed += 1
+            print(f"  ✗ [{idx}/{len(phones)}] Failed to download images for {phone_name}")
         
-        # Delay before next phone
+        # Delay before this worker picks up its next phone
         if idx < len(phones):
-            print(f"  Waiting {delay} seconds...")
             time.sleep(delay)
+        
+        return phone_name, record
+    
+    # Process phones concurrently, max_workers at a time
+    successful = 0
+    failed = 0
+    total_images = 0
+    
+    print(f"Processing with {max_workers} workers, {delay}s delay per worker between phones")
+    
+    with open(manifest_file, 'w', encoding='utf-8') as manifest_f, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for phone_name, record in executor.map(process_phone, range(1, len(phones) + 1), phones):
+            if record:
+                manifest_f.write(json.dumps({'phone_name': phone_name, **record}, ensure_ascii=False) + '\n')
+                manifest_f.flush()
+                successful += 1
+                total_images += record['image_count']
+            else:
+                failed += 1
     
     # Summary
     print("\n" + "=" * 80)
     print(f"\n✓ Image download complete!")
     print(f"  Successful: {successful}/{len(phones)}")
     print(f"  Failed: {failed}/{len(phones)}")
-    print(f"  Total images downloaded: {sum(r['image_count'] for r in results.values())}")
+    print(f"  Total images downloaded: {total_images}")
     print(f"  Images saved to: {os.path.abspath(images_dir)}")
+    print(f"  Manifest lines written to: {manifest_file}")
     print("=" * 80)
     
-    return results
+    return successful
 
-def save_image_manifest(results, filename='image_manifest.json'):
+def save_image_manifest(manifest_file='image_manifest.jsonl', filename='image_manifest.json'):
     """
-    Save a manifest of downloaded images with clean naming info
+    Convert the line-per-phone manifest into the indented JSON manifest,
+    keyed by phone name
     """
     try:
+        results = {}
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    results[record.pop('phone_name')] = record
+        
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"\n✓ Image manifest saved to {filename}")
@@ -434,6 +553,7 @@ if __name__ == "__main__":
     MAX_IMAGES_PER_PHONE = 5                   # Maximum images per phone
     DELAY = 3                                  # Delay between phones (seconds)
     START_FROM = 0                             # Start from this index
+    MAX_WORKERS = 3                            # Phones processed concurrently
     
     print(f"\nConfiguration:")
     print(f"  Input CSV: {INPUT_CSV}")
@@ -442,23 +562,25 @@ if __name__ == "__main__":
     print(f"  Max Images per Phone: {MAX_IMAGES_PER_PHONE}")
     print(f"  Delay: {DELAY} seconds")
     print(f"  Start From: Phone #{START_FROM + 1}")
+    print(f"  Workers: {MAX_WORKERS}")
     print()
     
     # Process phones and download images
-    results = process_phones_from_csv(
+    successful = process_phones_from_csv(
         csv_file=INPUT_CSV,
         images_dir=IMAGES_DIR,
         max_phones=5,  # Test with 5 phones first
         max_images_per_phone=MAX_IMAGES_PER_PHONE,
         delay=DELAY,
-        start_from=START_FROM
+        start_from=START_FROM,
+        max_workers=MAX_WORKERS
     )
     
     # Save manifest
-    if results:
-        save_image_manifest(results)
+    if successful:
+        save_image_manifest()
         print(f"\n{'='*80}")
-        print(f"✓ Successfully processed {len(results)} phones!")
+        print(f"✓ Successfully processed {successful} phones!")
         print(f"{'='*80}")
         
         # Print new directory structure
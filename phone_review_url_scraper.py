@@ -1,17 +1,53 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
+import re
 import time
-from urllib.parse import urljoin
 
-def scrape_single_page(url, headers):
+# Only build the review item subtrees when parsing a reviews page
+REVIEW_ITEMS_STRAINER = SoupStrainer(class_=re.compile(r'\breview-item'))
+
+def create_session(headers):
+    """
+    Create a pooled HTTP session so all requests to gsmarena.com reuse connections
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('https://', adapter)
+    
+    return session
+
+
+def absolute_url(src, base='https://www.gsmarena.com/'):
+    """Make a review link absolute (same helper as in phone_image_scraper.py)"""
+    if src.startswith(('http://', 'https://')):
+        return src
+    if src.startswith('//'):
+        return 'https:' + src
+    return base + src.lstrip('/')
+
+
+def scrape_single_page(url, session):
     """
     Scrape a single page of reviews
     """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = session.get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=REVIEW_ITEMS_STRAINER)
         
         reviews = []
         
@@ -39,7 +75,7 @@ def scrape_single_page(url, headers):
                 link = title.find('a') if title.name != 'a' else title
                 if link and link.get('href'):
                     href = link['href']
-                    review_data['review_url'] = urljoin('https://www.gsmarena.com/', href)
+                    review_data['review_url'] = absolute_url(href)
             
             # Extract image
             img = item.find('img')
@@ -88,10 +124,10 @@ def scrape_gsmarena_reviews(base_url="https://www.gsmarena.com/reviews.php3",
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1'
     }
+    session = create_session(headers)
     
     all_reviews = []
     page_num = start_page
@@ -112,7 +148,7 @@ def scrape_gsmarena_reviews(base_url="https://www.gsmarena.com/reviews.php3",
         print(f"URL: {current_url}")
         
         # Scrape current page
-        reviews, has_content = scrape_single_page(current_url, headers)
+        reviews, has_content = scrape_single_page(current_url, session)
         
         if reviews:
             all_reviews.extend(reviews)
@@ -1,19 +1,82 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml.etree import XPath
 import json
 import time
 import csv
+import random
 import re
+import sys
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def find_spec_url_from_review(review_url, headers):
+try:
+    import orjson
+except ImportError:  # fall back to the standard library encoder
+    orjson = None
+
+# Spec page URLs end with the phone id, e.g. infinix_hot_60_pro+-14002.php
+_SPEC_URL_RE = re.compile(r'-\d{4,5}\.php')
+_SPEC_KEYWORDS = ('specification', 'specs', 'full phone')
+
+# Phones between full JSON checkpoint rewrites; every phone is also appended
+# to <output_file>.ndjson as it completes
+CHECKPOINT_EVERY = 25
+
+# Format of the parsed specifications kept in the HTTP cache. Bump it whenever
+# scrape_specifications changes what it extracts, so a 304 never serves
+# specifications parsed by an older version
+SPEC_CACHE_VERSION = 1
+
+# Spec page locators, compiled once and reused for every page
+_XP_TITLE = XPath("//h1[contains(concat(' ', normalize-space(@class), ' '), ' specs-phone-name-title ')]")
+_XP_SPECS_TABLES = XPath("//div[@id='specs-list']//table")
+_XP_TTL = XPath("./td[contains(concat(' ', normalize-space(@class), ' '), ' ttl ')]")
+_XP_NFO = XPath("./td[contains(concat(' ', normalize-space(@class), ' '), ' nfo ')]")
+
+# Only links matter on a review page
+_LINKS_STRAINER = SoupStrainer('a', href=True)
+
+
+def create_session(headers, max_connections=8):
+    """
+    Create a pooled HTTP session so all requests to gsmarena.com reuse connections
+    
+    The pool holds max_connections keep-alive connections per host and blocks
+    when they are all in use, so concurrent workers queue for a warm
+    connection instead of opening throwaway ones. 429/503 responses wait
+    for their Retry-After, otherwise retries back off exponentially
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max_connections,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('https://', adapter)
+    
+    return session
+
+
+def find_spec_url_from_review(review_url, session):
     """
     Find the specifications URL from a review page
     """
     try:
-        response = requests.get(review_url, headers=headers, timeout=15)
+        response = session.get(review_url, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_LINKS_STRAINER)
         
         # Look for dropdown menu or links to specifications
         # Common patterns: "Full specifications", "Specifications", etc.
@@ -26,7 +89,7 @@ def find_spec_url_from_review(review_url, headers):
             text = link.get_text(strip=True).lower()
             
             # Look for specification links
-            if 'specification' in text or 'specs' in text or 'full phone' in text:
+            if any(keyword in text for keyword in _SPEC_KEYWORDS):
                 if '.php' in href:
                     spec_link = urljoin('https://www.gsmarena.com/', href)
                     break
@@ -39,7 +102,7 @@ def find_spec_url_from_review(review_url, headers):
             for link in links:
                 href = link['href']
                 # Look for phone specification page pattern (ends with -XXXX.php)
-                if re.search(r'-\d{4,5}\.php', href) and 'review' not in href:
+                if _SPEC_URL_RE.search(href) and 'review' not in href:
                     spec_link = urljoin('https://www.gsmarena.com/', href)
                     break
         
@@ -50,92 +113,177 @@ def find_spec_url_from_review(review_url, headers):
         return None
 
 
-def scrape_specifications(spec_url, headers):
+def _clean_text(element):
+    """Element text with runs of whitespace collapsed, in one C-level pass"""
+    return ' '.join(element.text_content().split())
+
+
+def scrape_specifications(spec_url, session, cache=None):
     """
     Scrape all specifications from a phone specification page
+    Returns (specifications, spec_count), or (None, 0) on error
+    
+    When a cache dict (see load_http_cache) is given, the request is made
+    conditional on the stored ETag/Last-Modified, and a 304 reuses the
+    previously parsed specifications
     """
     try:
-        response = requests.get(spec_url, headers=headers, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        pages = cache['pages'] if cache is not None else {}
+        cached = pages.get(spec_url)
+        
+        conditional_headers = {}
+        if cached:
+            if cached.get('etag'):
+                conditional_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Stream the body straight into lxml instead of buffering it first
+        with session.get(spec_url, timeout=15, headers=conditional_headers, stream=True) as response:
+            if response.status_code == 304 and cached:
+                print(f"  ✓ Not modified, reusing cached specifications")
+                return dict(cached['specifications']), cached.get('spec_count', 0)
+            
+            response.raise_for_status()
+            response.raw.decode_content = True
+            doc = lxml.html.parse(response.raw).getroot()
         
         specifications = {}
+        spec_count = 0
         
         # Find the phone name/title
-        phone_title = soup.find('h1', class_='specs-phone-name-title')
+        phone_title = _XP_TITLE(doc)
         if phone_title:
-            specifications['phone_name'] = phone_title.get_text(strip=True)
+            specifications['phone_name'] = _clean_text(phone_title[0])
         
-        # Find all specification tables
-        spec_tables = soup.find_all('table')
+        extracted_any = False
         
-        for table in spec_tables:
-            # Get category header (e.g., "Network", "Body", "Display")
-            category_header = table.find_previous('th')
-            if category_header:
-                category = category_header.get_text(strip=True)
-            else:
-                category = "General"
+        # Canonical GSMArena layout: each table in div#specs-list holds its
+        # own category header and td.ttl / td.nfo name-value cells. Category
+        # and spec names repeat on every phone, so they are interned and
+        # shared across all phones
+        for table in _XP_SPECS_TABLES(doc):
+            header = table.find('.//th')
+            if header is None:
+                continue
             
-            # Initialize category in specifications if not exists
+            category = sys.intern(_clean_text(header))
             if category not in specifications:
                 specifications[category] = {}
             
-            # Extract all rows in the table
-            rows = table.find_all('tr')
-            
-            for row in rows:
-                cells = row.find_all('td')
+            for row in table.iterfind('.//tr'):
+                cells = _XP_TTL(row)
+                values = _XP_NFO(row)
                 
-                if len(cells) >= 2:
-                    # First cell is the spec name, second is the value
-                    spec_name = cells[0].get_text(strip=True)
-                    spec_value = cells[1].get_text(strip=True)
-                    
-                    # Clean up the spec name (remove links text, icons, etc.)
-                    spec_name = re.sub(r'\s+', ' ', spec_name)
-                    spec_value = re.sub(r'\s+', ' ', spec_value)
+                for cell, value in zip(cells, values):
+                    spec_name = sys.intern(_clean_text(cell))
+                    spec_value = _clean_text(value)
                     
                     if spec_name and spec_value:
+                        if spec_name not in specifications[category]:
+                            spec_count += 1
                         specifications[category][spec_name] = spec_value
+                        extracted_any = True
         
-        # Alternative parsing method if the above doesn't work
-        if len(specifications) <= 1:
-            # Look for spec list items
-            spec_list = soup.find('div', id='specs-list')
-            if spec_list:
-                categories = spec_list.find_all('table')
+        # Fallback for other layouts: walk headers and tables in document
+        # order, so each table takes the last header seen before it
+        if not extracted_any:
+            last_header = None
+            
+            for element in doc.iter('th', 'table'):
+                if element.tag == 'th':
+                    last_header = sys.intern(_clean_text(element))
+                    continue
                 
-                for table in categories:
-                    # Get the category name from the header
-                    header = table.find('th')
-                    if header:
-                        category = header.get_text(strip=True)
-                        specifications[category] = {}
+                table = element
+                category = last_header if last_header is not None else "General"
+                
+                # Initialize category in specifications if not exists
+                if category not in specifications:
+                    specifications[category] = {}
+                
+                # Extract all rows in the table
+                for row in table.iterfind('.//tr'):
+                    cells = row.findall('td')
+                    
+                    if len(cells) >= 2:
+                        # First cell is the spec name, second is the value
+                        spec_name = sys.intern(_clean_text(cells[0]))
+                        spec_value = _clean_text(cells[1])
                         
-                        # Get all spec rows
-                        rows = table.find_all('tr')
-                        for row in rows:
-                            cells = row.find_all('td', class_='ttl')
-                            values = row.find_all('td', class_='nfo')
-                            
-                            if cells and values:
-                                for cell, value in zip(cells, values):
-                                    spec_name = cell.get_text(strip=True)
-                                    spec_value = value.get_text(strip=True)
-                                    
-                                    if spec_name and spec_value:
-                                        specifications[category][spec_name] = spec_value
+                        if spec_name and spec_value:
+                            if spec_name not in specifications[category]:
+                                spec_count += 1
+                            specifications[category][spec_name] = spec_value
         
-        return specifications
+        # Remember validators so the next run can ask for a 304
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if cache is not None and (etag or last_modified):
+            pages[spec_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'specifications': dict(specifications),
+                'spec_count': spec_count
+            }
+        
+        return specifications, spec_count
         
     except Exception as e:
         print(f"  ✗ Error scraping specifications: {e}")
-        return None
+        return None, 0
+
+
+def load_http_cache(filename):
+    """
+    Load the HTTP cache, or start an empty one
+    
+    'pages' maps spec URL -> ETag/Last-Modified and parsed specifications,
+    'spec_urls' maps review URL -> spec URL found on that review page.
+    Cached pages from another SPEC_CACHE_VERSION are dropped
+    """
+    cache = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"✗ Error reading cache {filename}, starting fresh: {e}")
+    
+    if cache.get('version') != SPEC_CACHE_VERSION:
+        if cache.get('pages'):
+            print(f"ℹ Cache {filename} is from another parser version, re-parsing all pages")
+        cache['pages'] = {}
+        cache['version'] = SPEC_CACHE_VERSION
+    
+    cache.setdefault('pages', {})
+    cache.setdefault('spec_urls', {})
+    return cache
+
+
+def load_known_spec_urls(filename):
+    """
+    Map review URL -> spec URL from the _metadata of a previous output JSON
+    """
+    known = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            for phone_specs in json.load(f):
+                metadata = phone_specs.get('_metadata') or {}
+                if metadata.get('review_url') and metadata.get('spec_url'):
+                    known[metadata['review_url']] = metadata['spec_url']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"✗ Error reading previous specifications from {filename}: {e}")
+    
+    return known
 
 
 def scrape_specs_from_csv(csv_file, output_file="gsmarena_specifications.json",
-                          max_phones=None, delay=2, start_from=0):
+                          max_phones=None, min_delay=1, max_delay=3, start_from=0, max_workers=8,
+                          cache_file="spec_cache.json"):
     """
     Read review URLs from CSV and scrape specifications for each phone
     
@@ -143,8 +291,13 @@ def scrape_specs_from_csv(csv_file, output_file="gsmarena_specifications.json",
         csv_file: Path to CSV file with review_url column
         output_file: Output JSON file path
         max_phones: Maximum number of phones to scrape (None = all)
-        delay: Delay in seconds between requests
+        min_delay: Shortest delay in seconds between phones, per worker
+        max_delay: Longest delay in seconds between phones, per worker
         start_from: Start from this phone index (for resuming)
+        max_workers: Number of phones scraped concurrently
+        cache_file: JSON cache of ETag/Last-Modified and parsed specs per spec URL,
+                    and of the spec URL found for each review URL
+                    (None disables the cache)
     """
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -152,13 +305,22 @@ def scrape_specs_from_csv(csv_file, output_file="gsmarena_specifications.json",
         'Accept-Language': 'en-US,en;q=0.5',
         'Connection': 'keep-alive',
     }
+    # Accept-Encoding is left to requests, which advertises br when brotli is installed
+    session = create_session(headers, max_connections=max_workers)
+    cache = load_http_cache(cache_file) if cache_file else None
+    
+    # Phones already in the previous output resolve their spec URL without
+    # fetching the review page again
+    if cache is not None:
+        for review_url, spec_url in load_known_spec_urls(output_file).items():
+            cache['spec_urls'].setdefault(review_url, spec_url)
     
     # Read CSV file
     print(f"Reading review URLs from {csv_file}...")
     phone_data = []
     
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
+        with open(csv_file, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
             reader = csv.DictReader(f)
             for row in reader:
                 if 'review_url' in row and row['review_url']:
@@ -184,48 +346,49 @@ def scrape_specs_from_csv(csv_file, output_file="gsmarena_specifications.json",
     
     print("=" * 80)
     
-    # Scrape specifications for each phone
-    all_specifications = []
+    # Scrape specifications concurrently, max_workers phones at a time
+    results = [None] * len(phone_data)
+    completed = 0
     
-    for idx, phone_info in enumerate(phone_data, 1):
-        print(f"\n[{idx}/{len(phone_data)}] {phone_info['phone_name']}")
-        print(f"  Review URL: {phone_info['review_url']}")
-        
-        # Find specification URL
-        spec_url = find_spec_url_from_review(phone_info['review_url'], headers)
-        
-        if spec_url:
-            print(f"  ✓ Found spec URL: {spec_url}")
-            
-            # Scrape specifications
-            specifications = scrape_specifications(spec_url, headers)
+    try:
+        with open(output_file + '.ndjson', 'w', encoding='utf-8') as progress_f, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_phone, idx, len(phone_data), phone_info, session,
+                                min_delay, max_delay, cache): idx
+                for idx, phone_info in enumerate(phone_data, 1)
+            }
             
-            if specifications:
-                # Add metadata
-                specifications['_metadata'] = {
-                    'phone_name': phone_info['phone_name'],
-                    'review_url': phone_info['review_url'],
-                    'spec_url': spec_url,
-                    'date': phone_info['date']
-                }
-                
-                all_specifications.append(specifications)
-                
-                # Count total specs
-                total_specs = sum(len(v) for k, v in specifications.items() if isinstance(v, dict))
-                print(f"  ✓ Extracted {len(specifications)-1} categories with {total_specs} specifications")
-                
-                # Save progress after each phone
-                save_to_json(all_specifications, output_file)
-            else:
-                print(f"  ✗ Failed to scrape specifications")
-        else:
-            print(f"  ✗ Could not find specification URL")
+            try:
+                for future in as_completed(futures):
+                    specifications = future.result()
+                    
+                    if specifications:
+                        results[futures[future] - 1] = specifications
+                        completed += 1
+                        
+                        # Append each phone to the progress log, rewrite the full JSON
+                        # checkpoint only every CHECKPOINT_EVERY phones
+                        progress_f.write(json.dumps(specifications, ensure_ascii=False) + '\n')
+                        progress_f.flush()
+                        
+                        if completed % CHECKPOINT_EVERY == 0:
+                            save_to_json([s for s in results if s], output_file)
+            except BaseException:
+                # Drop phones not started yet so an error or Ctrl-C only waits
+                # for the ones in flight
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        # Keep whatever this run scraped and resolved, even if it was cut short,
+        # but never replace a previous output with an empty run
+        all_specifications = [s for s in results if s]
+        if all_specifications:
+            save_to_json(all_specifications, output_file)
         
-        # Delay before next request
-        if idx < len(phone_data):
-            print(f"  Waiting {delay} seconds...")
-            time.sleep(delay)
+        if cache is not None:
+            save_to_json(cache, cache_file)
     
     print("\n" + "=" * 80)
     print(f"\n✓ Scraping complete!")
@@ -235,41 +398,98 @@ def scrape_specs_from_csv(csv_file, output_file="gsmarena_specifications.json",
     return all_specifications
 
 
+def process_phone(idx, total, phone_info, session, min_delay, max_delay, cache=None):
+    """
+    Find the spec URL for one phone and scrape its specifications
+    Sleeps a random min_delay-max_delay seconds afterwards so each worker
+    paces its requests
+    """
+    prefix = f"[{idx}/{total}]"
+    print(f"\n{prefix} {phone_info['phone_name']}")
+    print(f"  {prefix} Review URL: {phone_info['review_url']}")
+    
+    specifications = None
+    
+    # Find specification URL, skipping the review page when a previous run
+    # already resolved it
+    spec_urls = cache['spec_urls'] if cache is not None else {}
+    spec_url = spec_urls.get(phone_info['review_url'])
+    
+    if not spec_url:
+        spec_url = find_spec_url_from_review(phone_info['review_url'], session)
+        if spec_url and cache is not None:
+            spec_urls[phone_info['review_url']] = spec_url
+    
+    if spec_url:
+        print(f"  {prefix} ✓ Found spec URL: {spec_url}")
+        
+        # Scrape specifications
+        specifications, spec_count = scrape_specifications(spec_url, session, cache)
+        
+        if specifications:
+            # Add metadata
+            specifications['_metadata'] = {
+                'phone_name': phone_info['phone_name'],
+                'review_url': phone_info['review_url'],
+                'spec_url': spec_url,
+                'date': phone_info['date']
+            }
+            
+            print(f"  {prefix} ✓ Extracted {len(specifications)-1} categories with {spec_count} specifications")
+        else:
+            print(f"  {prefix} ✗ Failed to scrape specifications")
+    else:
+        print(f"  {prefix} ✗ Could not find specification URL")
+    
+    # Randomized delay before this worker's next phone
+    if idx < total:
+        time.sleep(random.uniform(min_delay, max_delay))
+    
+    return specifications
+
+
 def save_to_json(data, filename):
-    """Save data to JSON file"""
+    """Save data to JSON file, using orjson when it is installed"""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         return True
     except Exception as e:
         print(f"✗ Error saving JSON: {e}")
         return False
 
 
-def flatten_specs_for_csv(specs_data):
+def flatten_phone_specs(phone_specs):
     """
-    Flatten specifications into a format suitable for CSV
+    Flatten one phone's specifications into a single CSV row
     """
-    flattened = []
+    row = {}
     
-    for phone_specs in specs_data:
-        row = {}
-        
-        # Add metadata
-        if '_metadata' in phone_specs:
-            row.update(phone_specs['_metadata'])
-        
-        # Flatten all specification categories
-        for category, specs in phone_specs.items():
-            if category != '_metadata' and isinstance(specs, dict):
-                for spec_name, spec_value in specs.items():
-                    # Create column name as "Category - Spec Name"
-                    column_name = f"{category} - {spec_name}"
-                    row[column_name] = spec_value
-        
-        flattened.append(row)
+    # Add metadata
+    if '_metadata' in phone_specs:
+        row.update(phone_specs['_metadata'])
+    
+    # Flatten all specification categories
+    for category, specs in phone_specs.items():
+        if category != '_metadata' and isinstance(specs, dict):
+            for spec_name, spec_value in specs.items():
+                # Create column name as "Category - Spec Name"
+                column_name = f"{category} - {spec_name}"
+                row[column_name] = spec_value
     
-    return flattened
+    return row
+
+
+def flatten_specs_for_csv(specs_data):
+    """
+    Flatten specifications into a format suitable for CSV, one row at a time
+    """
+    for phone_specs in specs_data:
+        yield flatten_phone_specs(phone_specs)
 
 
 def save_specs_to_csv(data, filename="gsmarena_specifications.csv"):
@@ -278,27 +498,30 @@ def save_specs_to_csv(data, filename="gsmarena_specifications.csv"):
         if not data:
             return False
         
-        # Flatten the nested specifications
-        flattened_data = flatten_specs_for_csv(data)
-        
-        if not flattened_data:
-            return False
+        # Union spec names per category straight from the nested data, then
+        # build each "Category - Spec Name" column once
+        metadata_keys = set()
+        category_specs = {}
+        for phone_specs in data:
+            metadata_keys.update(phone_specs.get('_metadata', ()))
+            for category, specs in phone_specs.items():
+                if category != '_metadata' and isinstance(specs, dict):
+                    category_specs.setdefault(category, set()).update(specs)
         
-        # Get all unique column names
-        all_columns = set()
-        for row in flattened_data:
-            all_columns.update(row.keys())
+        all_columns = set(metadata_keys)
+        for category, spec_names in category_specs.items():
+            all_columns.update(f"{category} - {spec_name}" for spec_name in spec_names)
         
         # Sort columns: metadata first, then alphabetically
         metadata_cols = ['phone_name', 'date', 'review_url', 'spec_url']
         spec_cols = sorted([col for col in all_columns if col not in metadata_cols])
         columns = [col for col in metadata_cols if col in all_columns] + spec_cols
         
-        # Write to CSV
-        with open(filename, 'w', encoding='utf-8', newline='') as f:
+        # Write to CSV through a 1 MB buffer, flattening one phone at a time
+        with open(filename, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
             writer = csv.DictWriter(f, fieldnames=columns)
             writer.writeheader()
-            writer.writerows(flattened_data)
+            writer.writerows(flatten_specs_for_csv(data))
         
         print(f"✓ Specifications saved to {filename}")
         print(f"  Columns: {len(columns)}")
@@ -318,16 +541,19 @@ if __name__ == "__main__":
     OUTPUT_JSON = "gsmarena_specifications.json"
     OUTPUT_CSV = "gsmarena_specifications.csv"
     MAX_PHONES = None       # Set to None to scrape all phones
-    DELAY = 2            # Delay in seconds between requests
+    MIN_DELAY = 1        # Shortest delay in seconds between requests
+    MAX_DELAY = 3        # Longest delay in seconds between requests
     START_FROM = 0       # Start from this index
+    MAX_WORKERS = 8      # Phones scraped concurrently
     
     print(f"\nConfiguration:")
     print(f"  Input CSV: {INPUT_CSV}")
     print(f"  Output JSON: {OUTPUT_JSON}")
     print(f"  Output CSV: {OUTPUT_CSV}")
     print(f"  Max Phones: {MAX_PHONES if MAX_PHONES else 'All'}")
-    print(f"  Delay: {DELAY} seconds")
+    print(f"  Delay: {MIN_DELAY}-{MAX_DELAY} seconds")
     print(f"  Start From: Phone #{START_FROM + 1}")
+    print(f"  Workers: {MAX_WORKERS}")
     print()
     
     # Scrape specifications
@@ -335,8 +561,10 @@ if __name__ == "__main__":
         csv_file=INPUT_CSV,
         output_file=OUTPUT_JSON,
         max_phones=MAX_PHONES,
-        delay=DELAY,
-        start_from=START_FROM
+        min_delay=MIN_DELAY,
+        max_delay=MAX_DELAY,
+        start_from=START_FROM,
+        max_workers=MAX_WORKERS
     )
     
     # Save to both formats